@@ -0,0 +1,17 @@
+"""
+Password hashers tuned for the deployment hardware
+"""
+
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with OWASP minimum parameters (19 MiB, t=2, p=1)
+    Django's defaults (100 MiB, p=8) make login CPU-bound on small dynos.
+    Existing hashes keep verifying and are re-encoded on next login.
+    """
+    
+    time_cost = 2
+    memory_cost = 19456
+    parallelism = 1
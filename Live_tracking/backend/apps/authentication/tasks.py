@@ -40,6 +40,19 @@ def cleanup_inactive_sessions():
     return f"Deactivated {deleted_count} sessions"
 
 
+@shared_task
+def flush_expired_tokens():
+    """
+    Remove expired outstanding and blacklisted JWT refresh tokens
+    """
+    from django.core.management import call_command
+    
+    call_command('flushexpiredtokens')
+    
+    logger.info("Flushed expired JWT tokens")
+    return "Flushed expired tokens"
+
+
 @shared_task
 def send_password_expiry_notification():
     """
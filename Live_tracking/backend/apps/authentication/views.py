@@ -15,6 +15,7 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.utils import timezone
 from django.conf import settings
 import logging
@@ -127,33 +128,35 @@ class UserLoginView(APIView):
         access_token = str(refresh.access_token)
         refresh_token = str(refresh)
         
-        # Reset failed login attempts on successful login
-        user.reset_failed_logins()
-        
-        # Update user's last login info
-        user.last_login = timezone.now()
-        user.last_login_ip = ip_address
-        user.last_activity = timezone.now()
-        user.save(update_fields=['last_login', 'last_login_ip', 'last_activity'])
-        
-        # Step 6: Create user session for tracking
-        UserSession.objects.create(
-            user=user,
-            token_jti=str(refresh['jti']),
-            ip_address=ip_address,
-            user_agent=user_agent,
-            expires_at=timezone.now() + settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME']
-        )
-        
-        # Step 7: Log successful authentication
-        AuditLog.objects.create(
-            user=user,
-            action='login',
-            resource_type='authentication',
-            description=f'User logged in successfully',
-            ip_address=ip_address,
-            user_agent=user_agent
-        )
+        # Persist login bookkeeping in a single transaction
+        with transaction.atomic():
+            # Reset failed login attempts on successful login
+            user.reset_failed_logins()
+            
+            # Update user's last login info
+            user.last_login = timezone.now()
+            user.last_login_ip = ip_address
+            user.last_activity = timezone.now()
+            user.save(update_fields=['last_login', 'last_login_ip', 'last_activity'])
+            
+            # Step 6: Create user session for tracking
+            UserSession.objects.create(
+                user=user,
+                token_jti=str(refresh['jti']),
+                ip_address=ip_address,
+                user_agent=user_agent,
+                expires_at=timezone.now() + settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME']
+            )
+            
+            # Step 7: Log successful authentication
+            AuditLog.objects.create(
+                user=user,
+                action='login',
+                resource_type='authentication',
+                description=f'User logged in successfully',
+                ip_address=ip_address,
+                user_agent=user_agent
+            )
         
         logger.info(f"Successful login for {email} from IP: {ip_address}")
         
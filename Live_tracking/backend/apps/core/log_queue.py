@@ -0,0 +1,104 @@
+"""
+Move log handler I/O off the request thread
+Each distinct handler is fronted by one QueueHandler and drained by one
+QueueListener running in a background thread.
+"""
+
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from django.conf import settings
+
+# Original handler -> (QueueHandler, QueueListener); one writer thread per
+# handler keeps records from loggers sharing a file/stream in order
+_queues = {}
+
+
+def _start_listener(queue_handler, handler):
+    """
+    Start a background listener draining queue_handler's queue into handler
+    """
+    listener = QueueListener(queue_handler.queue, handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def _queue_handler_for(handler):
+    """
+    Return the QueueHandler shared by every logger using handler
+    """
+    if handler not in _queues:
+        queue_handler = QueueHandler(queue.SimpleQueue())
+        _queues[handler] = (queue_handler, _start_listener(queue_handler, handler))
+    return _queues[handler][0]
+
+
+def _queue_logger(logger):
+    """
+    Swap a logger's handlers for QueueHandlers feeding background listeners
+    """
+    logger.handlers = [
+        h if isinstance(h, QueueHandler) else _queue_handler_for(h)
+        for h in logger.handlers
+    ]
+
+
+def _stop_listeners():
+    """
+    Stop listener threads, writing out records already queued
+    """
+    for _, listener in _queues.values():
+        listener.stop()
+
+
+def _restart_listeners():
+    """
+    Start new listener threads on the existing queues
+    """
+    for handler, (queue_handler, _) in _queues.items():
+        _queues[handler] = (queue_handler, _start_listener(queue_handler, handler))
+
+
+def _restart_listeners_in_child():
+    """
+    Listener threads do not survive fork; start them on fresh queues
+    The inherited queues may hold the parent's records or be mid-operation.
+    """
+    for queue_handler, _ in _queues.values():
+        queue_handler.queue = queue.SimpleQueue()
+    _restart_listeners()
+
+
+def _shutdown():
+    """
+    Flush pending records on interpreter shutdown
+    """
+    _stop_listeners()
+    _queues.clear()
+
+
+def start_log_queue():
+    """
+    Route every logger declared in settings.LOGGING through a queue
+    Safe to call more than once per process.
+    """
+    if _queues:
+        return
+    
+    logger_names = getattr(settings, 'LOGGING', {}).get('loggers', {})
+    for name in logger_names:
+        _queue_logger(logging.getLogger(name))
+    _queue_logger(logging.getLogger())
+
+
+# Drain before fork so gunicorn preload_app and Celery prefork children
+# start with empty queues and their own listener threads
+os.register_at_fork(
+    before=_stop_listeners,
+    after_in_parent=_restart_listeners,
+    after_in_child=_restart_listeners_in_child,
+)
+atexit.register(_shutdown)
@@ -0,0 +1,46 @@
+"""
+orjson-backed renderer and parser for DRF
+Drop-in replacements for JSONRenderer/JSONParser on the telemetry endpoints
+"""
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# DRF's encoder covers the types orjson does not (Decimal, lazy strings, QuerySets)
+_encoder_default = JSONEncoder().default
+
+# OPT_NON_STR_KEYS matches json.dumps, which stringifies int/float/bool dict keys
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Renderer which serializes to JSON using orjson
+    """
+    
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=_encoder_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONParser(BaseParser):
+    """
+    Parser which deserializes JSON request bodies using orjson
+    """
+    
+    media_type = 'application/json'
+    renderer_class = ORJSONRenderer
+    
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
@@ -0,0 +1,192 @@
+import io
+import json
+import logging
+import os
+import tempfile
+import time
+from decimal import Decimal
+from logging.handlers import QueueHandler
+from unittest import skipUnless
+
+import numpy
+import orjson
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+
+from . import log_queue
+from .renderers import ORJSONParser, ORJSONRenderer
+
+
+class LogQueueTests(SimpleTestCase):
+    """
+    Tests for moving logger handlers behind a QueueListener
+    """
+    
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.handler = logging.StreamHandler(self.stream)
+        self.handler.setLevel(logging.WARNING)
+        
+        self.logger = logging.getLogger('apps.core.tests.queue')
+        self.logger.handlers = [self.handler]
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        
+        log_queue._queue_logger(self.logger)
+    
+    def tearDown(self):
+        self.stop_listener()
+        self.logger.handlers = []
+    
+    def stop_listener(self):
+        if self.handler in log_queue._queues:
+            _, listener = log_queue._queues.pop(self.handler)
+            listener.stop()
+    
+    def test_handlers_replaced_by_queue_handler(self):
+        self.assertEqual(len(self.logger.handlers), 1)
+        self.assertIsInstance(self.logger.handlers[0], QueueHandler)
+        self.assertIs(self.logger.handlers[0], log_queue._queues[self.handler][0])
+    
+    def test_records_reach_original_handler(self):
+        self.logger.warning('vessel %s lost signal', '219000606')
+        self.stop_listener()
+        
+        self.assertEqual(self.stream.getvalue(), 'vessel 219000606 lost signal\n')
+    
+    def test_shared_handler_keeps_record_order(self):
+        other = logging.getLogger('apps.core.tests.queue.other')
+        other.handlers = [self.handler]
+        other.setLevel(logging.DEBUG)
+        other.propagate = False
+        self.addCleanup(setattr, other, 'handlers', [])
+        log_queue._queue_logger(other)
+        
+        self.assertIs(other.handlers[0], self.logger.handlers[0])
+        
+        expected = []
+        for i in range(2000):
+            logger = self.logger if i % 2 else other
+            logger.warning('record %d', i)
+            expected.append(f'record {i}')
+        self.stop_listener()
+        
+        self.assertEqual(self.stream.getvalue().splitlines(), expected)
+    
+    def test_handler_level_respected(self):
+        self.logger.info('below handler level')
+        self.logger.error('above handler level')
+        self.stop_listener()
+        
+        self.assertEqual(self.stream.getvalue(), 'above handler level\n')
+    
+    def test_already_queued_logger_not_wrapped_again(self):
+        queue_handler = self.logger.handlers[0]
+        log_queue._queue_logger(self.logger)
+        
+        self.assertEqual(self.logger.handlers, [queue_handler])
+
+
+@skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+class LogQueueForkTests(SimpleTestCase):
+    """
+    Tests for listener handling across fork (gunicorn preload, Celery prefork)
+    """
+    
+    def setUp(self):
+        log_file = tempfile.NamedTemporaryFile(suffix='.log', delete=False)
+        log_file.close()
+        self.log_path = log_file.name
+        self.addCleanup(os.remove, self.log_path)
+        
+        self.handler = logging.FileHandler(self.log_path)
+        self.logger = logging.getLogger('apps.core.tests.fork')
+        self.logger.handlers = [self.handler]
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        
+        log_queue._queue_logger(self.logger)
+    
+    def tearDown(self):
+        self.stop_listener()
+        self.logger.handlers = []
+        self.handler.close()
+    
+    def stop_listener(self):
+        if self.handler in log_queue._queues:
+            _, listener = log_queue._queues.pop(self.handler)
+            listener.stop()
+    
+    def wait_for_child(self, pid, timeout=10):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            finished, status = os.waitpid(pid, os.WNOHANG)
+            if finished:
+                return os.waitstatus_to_exitcode(status)
+            time.sleep(0.01)
+        os.kill(pid, 9)
+        os.waitpid(pid, 0)
+        self.fail('forked child hung while stopping its log listeners')
+    
+    def test_fork_neither_duplicates_nor_hangs(self):
+        for i in range(200):
+            self.logger.info('parent %d', i)
+        
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                self.logger.info('child')
+                log_queue._shutdown()
+                exit_code = 0
+            finally:
+                os._exit(exit_code)
+        
+        self.assertEqual(self.wait_for_child(pid), 0)
+        
+        self.logger.info('parent after fork')
+        self.stop_listener()
+        
+        with open(self.log_path) as log:
+            lines = log.read().splitlines()
+        
+        self.assertEqual(sum(line.startswith('parent ') for line in lines), 201)
+        self.assertEqual(lines.count('child'), 1)
+        self.assertEqual(lines[-1], 'parent after fork')
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """
+    Tests for the orjson renderer and parser
+    """
+    
+    def render(self, data):
+        return orjson.loads(ORJSONRenderer().render(data))
+    
+    def test_decimal_and_lazy_string(self):
+        data = {'speed': Decimal('12.30'), 'label': gettext_lazy('Cargo')}
+        
+        self.assertEqual(self.render(data), {'speed': 12.3, 'label': 'Cargo'})
+    
+    def test_numpy_values(self):
+        data = {'avg_speed': numpy.float64(10.5), 'positions': numpy.array([1, 2, 3])}
+        
+        self.assertEqual(self.render(data), {'avg_speed': 10.5, 'positions': [1, 2, 3]})
+    
+    def test_non_str_keys(self):
+        data = {2024: 5, 1.5: 'a', True: 'b'}
+        
+        self.assertEqual(self.render(data), json.loads(json.dumps(data)))
+    
+    def test_none_renders_empty_body(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+    
+    def test_parse(self):
+        stream = io.BytesIO(b'{"mmsi": "219000606", "heading": 244}')
+        
+        self.assertEqual(ORJSONParser().parse(stream), {'mmsi': '219000606', 'heading': 244})
+    
+    def test_malformed_body_raises_parse_error(self):
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"mmsi": '))
@@ -0,0 +1,18 @@
+"""
+Pagination classes for vessel tracking module
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class VesselPositionCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the position history feed.
+    Avoids COUNT(*) and OFFSET scans on the ever-growing positions table.
+    id breaks ties between positions sharing an AIS batch timestamp.
+    """
+    
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    ordering = ('-timestamp', '-id')
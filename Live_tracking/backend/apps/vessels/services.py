@@ -4,6 +4,7 @@ Handles AIS integration and business logic
 """
 
 from django.utils import timezone
+from django.db import transaction
 from django.db.models import Q, Avg, Count
 from decimal import Decimal
 from datetime import timedelta
@@ -107,6 +108,7 @@ class VesselService:
         return track_data
     
     @staticmethod
+    @transaction.atomic
     def update_vessel_position(vessel, position_data):
         """
         Update vessel's current position and create historical record
@@ -8,6 +8,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.utils import timezone
+from django.db import transaction
 from django.db.models import Q
 from django.conf import settings
 from datetime import datetime, timedelta
@@ -22,6 +23,7 @@ from .serializers import (
     VesselTrackSerializer, VesselSearchSerializer
 )
 from .services import VesselService, AISIntegrationService, VesselAnalyticsService
+from .pagination import VesselPositionCursorPagination
 from .analytics import VesselAnalytics
 
 logger = logging.getLogger(__name__)
@@ -614,9 +616,10 @@ class VesselPositionViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = VesselPosition.objects.all()
     serializer_class = VesselPositionSerializer
     permission_classes = [IsAuthenticated, IsOperator]
+    pagination_class = VesselPositionCursorPagination
     filterset_fields = ['vessel', 'data_source']
     ordering_fields = ['timestamp']
-    ordering = ['-timestamp']
+    ordering = ['-timestamp', '-id']
     
     def list(self, request, *args, **kwargs):
         """List positions with filters"""
@@ -775,6 +778,7 @@ class VesselRouteViewSet(viewsets.ModelViewSet):
         }, status=status.HTTP_201_CREATED)
     
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsAnalyst])
+    @transaction.atomic
     def activate(self, request, pk=None):
         """
         Activate a route (deactivates other routes for the same vessel)
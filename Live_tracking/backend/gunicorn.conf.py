@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for Maritime Project
+"""
+
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+
+# Import Django once in the master so workers share settings/app pages copy-on-write
+preload_app = True
+
+
+def _default_workers():
+    """2 * usable CPUs + 1, capped at 4 so large hosts don't over-spawn containers"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    return min(cpus * 2 + 1, 4)
+
+
+workers = int(os.environ.get('WEB_CONCURRENCY', _default_workers()))
+timeout = 120
+
+
+def post_fork(server, worker):
+    """Drop any DB connections inherited from the master process"""
+    from django.db import connections
+    connections.close_all()
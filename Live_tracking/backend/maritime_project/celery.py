@@ -44,6 +44,11 @@ app.conf.beat_schedule = {
         'task': 'apps.authentication.tasks.cleanup_inactive_sessions',
         'schedule': crontab(hour=3, minute=0),  # Daily at 3:00 AM
     },
+    # Flush expired JWT tokens from the blacklist tables daily
+    'flush-expired-tokens': {
+        'task': 'apps.authentication.tasks.flush_expired_tokens',
+        'schedule': crontab(hour=4, minute=0),  # Daily at 4:00 AM
+    },
 }
 
 @app.task(bind=True)